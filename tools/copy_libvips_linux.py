@@ -13,13 +13,28 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import fnmatch
+import functools
+import json
 import logging
+import mmap
 import os
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    # Optional faster parser for the brew info JSON; its errors subclass json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Configure logging for GitHub Actions output
 logging.basicConfig(
     level=logging.INFO,
@@ -28,56 +43,230 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ELF constants used when reading the dynamic section
+SHT_DYNAMIC = 6
+DT_NULL = 0
+DT_NEEDED = 1
+DT_RPATH = 15
+DT_RUNPATH = 29
+
 
 def run_command(cmd: list[str], capture_output: bool = True, env=None) -> subprocess.CompletedProcess:
-    """Run a command and log it."""
-    logger.info(f"Running command: {' '.join(cmd)}")
+    """Run a command, logging it at debug level."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s", " ".join(cmd))
     result = subprocess.run(cmd, capture_output=capture_output, text=True, env=env)
     if result.returncode != 0:
-        logger.error(f"Command failed with code {result.returncode}")
+        logger.error("Command failed with code %d", result.returncode)
         if result.stderr:
-            logger.error(f"stderr: {result.stderr}")
+            logger.error("stderr: %s", result.stderr)
     return result
 
 
+def run_command_lines(cmd: list[str]) -> Iterator[str]:
+    """Run a command, yielding stdout lines as they are produced.
+    
+    Raises subprocess.CalledProcessError once the output has been consumed
+    if the command failed.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s", " ".join(cmd))
+    # stderr goes to a temporary file, not a pipe: it is only read once stdout
+    # is exhausted, so a child filling a stderr pipe would never finish
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True) as proc:
+            yield from proc.stdout
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+    if proc.returncode != 0:
+        logger.error("Command failed with code %d", proc.returncode)
+        if stderr:
+            logger.error("stderr: %s", stderr)
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+
+@functools.lru_cache(maxsize=None)
 def get_homebrew_prefix() -> Path:
     """Get the Homebrew prefix path."""
+    # `brew shellenv` exports the prefix, and brew itself lives in <prefix>/bin,
+    # so both avoid spawning a brew process. The brew path is deliberately not
+    # resolved: on Intel macOS and Linuxbrew it links into the repository dir.
+    env_prefix = os.environ.get("HOMEBREW_PREFIX")
+    if env_prefix:
+        return Path(env_prefix)
+    brew = shutil.which("brew")
+    if brew and Path(brew).parent.name == "bin":
+        return Path(brew).parent.parent
+    
     result = run_command(["brew", "--prefix"])
     if result.returncode != 0:
         raise RuntimeError("Failed to get Homebrew prefix")
     return Path(result.stdout.strip())
 
 
+# Package name -> {"prefix": Path | None, "version": str}, filled by query_packages
+_package_info: dict[str, dict] = {}
+
+
+def query_packages(packages: list[str]) -> dict[str, dict]:
+    """Query prefixes and versions of several Homebrew packages in one brew call.
+    
+    Results are cached, so packages that were already queried are not passed
+    to brew again.
+    """
+    missing = [p for p in packages if p not in _package_info]
+    if missing:
+        result = run_command(["brew", "info", "--json=v2", *missing])
+        formulae = []
+        if result.returncode == 0:
+            try:
+                formulae = json_loads(result.stdout).get("formulae", [])
+            except json.JSONDecodeError:
+                pass
+        
+        homebrew_prefix = get_homebrew_prefix()
+        for formula in formulae:
+            name = formula.get("name")
+            if not name:
+                continue
+            # Same path as `brew --prefix <name>`, but only if the keg is installed
+            prefix = homebrew_prefix / "opt" / name if formula.get("installed") else None
+            info = {
+                "prefix": prefix,
+                "version": formula.get("versions", {}).get("stable") or "unknown",
+            }
+            _package_info[name] = info
+            # Also record the name it was requested under (e.g. an alias)
+            for package in missing:
+                if package in (formula.get("full_name"), *formula.get("aliases", [])):
+                    _package_info[package] = info
+        
+        # Don't ask brew again for packages it reported nothing about
+        if result.returncode == 0:
+            for package in missing:
+                _package_info.setdefault(package, {"prefix": None, "version": "unknown"})
+    
+    return {p: _package_info[p] for p in packages if p in _package_info}
+
+
 def get_package_prefix(package: str) -> Path:
     """Get the prefix path for a specific Homebrew package."""
-    result = run_command(["brew", "--prefix", package])
-    if result.returncode != 0:
+    prefix = query_packages([package]).get(package, {}).get("prefix")
+    if prefix is None:
         raise RuntimeError(f"Failed to get prefix for {package}")
-    return Path(result.stdout.strip())
+    return prefix
 
 
 def get_package_version(package: str) -> str:
     """Get the version of a Homebrew package."""
-    result = run_command(["brew", "info", "--json=v2", package])
-    if result.returncode != 0:
-        return "unknown"
-    import json
+    return query_packages([package]).get(package, {}).get("version", "unknown")
+
+
+def read_elf_dynamic(so_path: Path) -> tuple[list[str], list[str]] | None:
+    """Read the DT_NEEDED and DT_RUNPATH/DT_RPATH entries of an ELF file.
+    
+    Returns a tuple of (needed, runpaths), or None if the file could not be
+    parsed as ELF.
+    """
     try:
-        data = json.loads(result.stdout)
-        if data.get("formulae"):
-            return data["formulae"][0].get("versions", {}).get("stable", "unknown")
-    except (json.JSONDecodeError, KeyError, IndexError):
-        pass
-    return "unknown"
+        with open(so_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:4] != b"\x7fELF":
+                return None
+            
+            endian = "<" if data[5] == 1 else ">"
+            if data[4] == 2:  # ELFCLASS64
+                (shoff,) = struct.unpack_from(endian + "Q", data, 0x28)
+                shentsize, shnum = struct.unpack_from(endian + "HH", data, 0x3A)
+                shdr_fmt = endian + "IIQQQQIIQQ"
+                dyn_fmt = endian + "qQ"
+            else:
+                (shoff,) = struct.unpack_from(endian + "I", data, 0x20)
+                shentsize, shnum = struct.unpack_from(endian + "HH", data, 0x2E)
+                shdr_fmt = endian + "IIIIIIIIII"
+                dyn_fmt = endian + "iI"
+            
+            # (sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, sh_link, ...)
+            sections = [
+                struct.unpack_from(shdr_fmt, data, shoff + i * shentsize)
+                for i in range(shnum)
+            ]
+            
+            needed = []
+            runpaths = []
+            dyn_size = struct.calcsize(dyn_fmt)
+            for section in sections:
+                if section[1] != SHT_DYNAMIC:
+                    continue
+                # sh_link of the dynamic section points at its string table
+                strtab_offset = sections[section[6]][4]
+                for offset in range(section[4], section[4] + section[5], dyn_size):
+                    tag, value = struct.unpack_from(dyn_fmt, data, offset)
+                    if tag == DT_NULL:
+                        break
+                    if tag in (DT_NEEDED, DT_RPATH, DT_RUNPATH):
+                        start = strtab_offset + value
+                        string = data[start:data.find(b"\0", start)].decode()
+                        if tag == DT_NEEDED:
+                            needed.append(string)
+                        else:
+                            runpaths.extend(string.split(":"))
+            return needed, runpaths
+    except (OSError, ValueError, IndexError, struct.error, UnicodeDecodeError):
+        return None
+
+
+# (st_dev, st_ino) of a library -> its dependencies, filled by get_so_deps
+_dep_cache: dict[tuple[int, int], list[str]] = {}
 
 
 def get_so_deps(so_path: Path) -> list[str]:
-    """Get the list of shared library dependencies using ldd or readelf."""
+    """Get the list of dependencies of a library, cached per inode.
+    
+    Symlinked aliases and repeated lookups of the same library share one
+    cache entry, so each file's dependencies are extracted only once.
+    """
+    try:
+        st = os.stat(so_path)
+    except OSError:
+        return _read_so_deps(so_path)
+    
+    key = (st.st_dev, st.st_ino)
+    if key not in _dep_cache:
+        _dep_cache[key] = _read_so_deps(so_path)
+    return list(_dep_cache[key])
+
+
+def _read_so_deps(so_path: Path) -> list[str]:
+    """Get the list of shared library dependencies.
+    
+    Dependencies are read straight from the ELF dynamic section. Entries that
+    can be found in the library's own RUNPATH are returned as absolute paths,
+    the rest as bare library names. Falls back to ldd or readelf if the file
+    cannot be parsed.
+    """
+    dynamic = read_elf_dynamic(so_path)
+    if dynamic is not None:
+        needed, runpaths = dynamic
+        origin = str(so_path.parent)
+        search_dirs = [
+            Path(p.replace("${ORIGIN}", origin).replace("$ORIGIN", origin))
+            for p in runpaths if p
+        ]
+        deps = []
+        for name in needed:
+            for search_dir in search_dirs:
+                candidate = search_dir / name
+                if candidate.exists():
+                    deps.append(str(candidate))
+                    break
+            else:
+                deps.append(name)
+        return deps
+    
     # Try ldd first
-    result = run_command(["ldd", str(so_path)])
-    if result.returncode == 0:
+    try:
         deps = []
-        for line in result.stdout.splitlines():
+        for line in run_command_lines(["ldd", str(so_path)]):
             line = line.strip()
             # Format: libname.so => /path/to/lib (0x...)
             if "=>" in line:
@@ -91,12 +280,13 @@ def get_so_deps(so_path: Path) -> list[str]:
                 path = line.split()[0]
                 deps.append(path)
         return deps
+    except subprocess.CalledProcessError:
+        pass
     
     # Fallback to readelf
-    result = run_command(["readelf", "-d", str(so_path)])
-    if result.returncode == 0:
+    try:
         deps = []
-        for line in result.stdout.splitlines():
+        for line in run_command_lines(["readelf", "-d", str(so_path)]):
             if "NEEDED" in line:
                 # Format: 0x... (NEEDED) Shared library: [libname.so]
                 start = line.find("[")
@@ -104,23 +294,81 @@ def get_so_deps(so_path: Path) -> list[str]:
                 if start != -1 and end != -1:
                     deps.append(line[start+1:end])
         return deps
+    except subprocess.CalledProcessError:
+        pass
     
     return []
 
 
+@functools.lru_cache(maxsize=None)
+def _list_dir(directory: Path) -> dict[str, os.DirEntry]:
+    """List a directory once, keyed by entry name."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
 def find_library(lib_name: str, search_paths: list[Path]) -> Path | None:
     """Find a library in the given search paths."""
     for search_path in search_paths:
-        lib_path = search_path / lib_name
-        if lib_path.exists():
-            return lib_path
+        entries = _list_dir(search_path)
+        # is_file() follows symlinks, so a dangling link is passed over
+        if lib_name in entries and entries[lib_name].is_file():
+            return search_path / lib_name
         # Also check for versioned libraries
-        for lib in search_path.glob(f"{lib_name}*"):
-            if lib.is_file():
-                return lib
+        for name, entry in entries.items():
+            if name.startswith(lib_name) and entry.is_file():
+                return Path(entry.path)
     return None
 
 
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file's data and metadata, keeping the data inside the kernel.
+    
+    Uses copy_file_range(2), which reflinks on filesystems that support it,
+    and falls back to shutil.copyfile where it is unavailable.
+    """
+    # Replace a symlink left by an earlier run instead of writing through it
+    if os.path.islink(dst):
+        os.unlink(dst)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            while True:
+                count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                if not count:
+                    break
+                copied += count
+        # Some filesystems report EOF from copy_file_range before the end of
+        # the file; never leave a short copy behind
+        if copied != size:
+            shutil.copyfile(src, dst)
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def copy_tree(src: Path, dst: Path) -> list[str]:
+    """Copy a directory tree with fast_copy, merging into an existing dst.
+    
+    Returns the names of the copied files.
+    """
+    copied = []
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = dst / entry.name
+            if entry.is_dir():
+                copied.extend(copy_tree(Path(entry.path), target))
+            elif entry.is_file():
+                fast_copy(Path(entry.path), target)
+                copied.append(entry.name)
+    return copied
+
+
 def copy_shared_libs_recursive(
     lib_path: Path,
     output_dir: Path,
@@ -128,12 +376,45 @@ def copy_shared_libs_recursive(
     homebrew_prefix: Path,
     search_paths: list[Path]
 ) -> None:
-    """Recursively copy a shared library and its dependencies."""
+    """Recursively copy a shared library and its dependencies.
+    
+    The dependency tree is walked breadth-first on a thread pool, so copying
+    one library overlaps with reading the dependencies of another.
+    """
+    # Already copied, e.g. as a dependency of an earlier library; don't
+    # start a pool just to find that out
+    if lib_path.name in copied:
+        return
+    
+    lock = threading.Lock()
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        pending = {
+            executor.submit(_copy_shared_lib, lib_path, output_dir, copied, lock, homebrew_prefix, search_paths)
+        }
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for dep_path in future.result():
+                    pending.add(executor.submit(
+                        _copy_shared_lib, dep_path, output_dir, copied, lock, homebrew_prefix, search_paths
+                    ))
+
+
+def _copy_shared_lib(
+    lib_path: Path,
+    output_dir: Path,
+    copied: set[str],
+    lock: threading.Lock,
+    homebrew_prefix: Path,
+    search_paths: list[Path]
+) -> list[Path]:
+    """Copy a single shared library and return the dependencies still to visit."""
     lib_name = lib_path.name
     
     # Skip if already copied
     if lib_name in copied:
-        return
+        return []
     
     # Skip system libraries
     system_prefixes = ["/lib", "/lib64", "/usr/lib", "/usr/lib64"]
@@ -141,64 +422,99 @@ def copy_shared_libs_recursive(
         # But include if it's a commonly needed library that might not be on target systems
         essential_libs = ["libstdc++", "libgcc_s"]
         if not any(essential in lib_name for essential in essential_libs):
-            logger.debug(f"Skipping system library: {lib_path}")
-            return
+            logger.debug("Skipping system library: %s", lib_path)
+            return []
     
     if not lib_path.exists():
-        logger.warning(f"Library not found: {lib_path}")
-        return
-    
-    logger.info(f"Copying: {lib_path}")
-    
-    # Resolve symlinks to get the actual file
-    real_path = lib_path.resolve()
-    
-    # Copy the file
-    dest_path = output_dir / lib_name
-    shutil.copy2(real_path, dest_path)
-    copied.add(lib_name)
-    
-    # Also copy symlinks if the original was a symlink
-    if lib_path.is_symlink():
-        symlink_name = lib_path.name
-        if symlink_name != real_path.name:
-            logger.info(f"  (resolved from symlink: {symlink_name} -> {real_path.name})")
-    
-    logger.info(f"  -> {dest_path}")
-    
-    # Get dependencies and copy them too
-    deps = get_so_deps(dest_path)
+        logger.warning("Library not found: %s", lib_path)
+        return []
+    
+    # Resolve symlinks to get the actual file; plain files are used as is,
+    # which saves resolve() an lstat per path component
+    is_symlink = lib_path.is_symlink()
+    real_path = lib_path.resolve() if is_symlink else lib_path
+    
+    # Claim the library and the file it points to, so no other worker copies them as well
+    with lock:
+        if lib_name in copied:
+            return []
+        copied.add(lib_name)
+        copy_real = real_path.name not in copied
+        copied.add(real_path.name)
+    
+    logger.info("Copying: %s", lib_path)
+    
+    # Copy the real file once. Its dependencies are read from the source,
+    # which is already in the page cache, rather than from the fresh copy
+    real_dest = output_dir / real_path.name
+    if copy_real:
+        deps = get_so_deps(real_path)
+        fast_copy(real_path, real_dest)
+        logger.info("  -> %s", real_dest)
+    
+    # Recreate aliases as symlinks to it instead of copying the data again
+    if real_path.name != lib_name:
+        dest_path = output_dir / lib_name
+        if os.path.lexists(dest_path):
+            os.unlink(dest_path)
+        os.symlink(real_path.name, dest_path)
+        logger.info("  -> %s (symlink to %s)", dest_path, real_path.name)
+    
+    # The worker that copied the real file walks its dependencies
+    if not copy_real:
+        return []
+    
+    # Collect dependencies so they get copied too
+    children = []
     for dep in deps:
         dep_path = Path(dep)
         
         # Only copy Homebrew dependencies or find them
         if str(dep_path).startswith(str(homebrew_prefix)):
-            copy_shared_libs_recursive(dep_path, output_dir, copied, homebrew_prefix, search_paths)
+            children.append(dep_path)
         elif not dep_path.is_absolute():
             # Try to find the library
             found = find_library(dep, search_paths)
             if found and str(found).startswith(str(homebrew_prefix)):
-                copy_shared_libs_recursive(found, output_dir, copied, homebrew_prefix, search_paths)
+                children.append(found)
+    return children
 
 
-def fix_library_rpath(output_dir: Path) -> None:
-    """Fix library RPATH for redistribution using patchelf."""
+def fix_library_rpath(output_dir: Path, so_files: list[Path] | None = None) -> None:
+    """Fix library RPATH for redistribution using patchelf.
+    
+    so_files may be passed in when the caller has already listed output_dir.
+    """
     logger.info("Fixing library RPATH for redistribution...")
     
-    # Check if patchelf is available
-    result = run_command(["which", "patchelf"])
-    if result.returncode != 0:
+    # Check if patchelf is available, keeping its absolute path so each
+    # run skips the PATH search
+    patchelf = shutil.which("patchelf")
+    if patchelf is None:
         logger.warning("patchelf not found, skipping RPATH fixing")
         logger.warning("Install patchelf with: sudo apt-get install patchelf")
         return
     
-    so_files = list(output_dir.glob("*.so*"))
+    if so_files is None:
+        so_files = list(output_dir.glob("*.so*"))
+    # Symlinked aliases share the real file, which must only be patched once
+    so_files = [so_file for so_file in so_files if not so_file.is_symlink()]
+    
+    if not so_files:
+        return
     
     for so_file in so_files:
-        logger.info(f"Fixing: {so_file.name}")
-        
-        # Set RPATH to $ORIGIN so libraries find each other
-        run_command(["patchelf", "--set-rpath", "$ORIGIN", str(so_file)])
+        logger.info("Fixing: %s", so_file.name)
+    
+    # Set RPATH to $ORIGIN so libraries find each other. patchelf accepts
+    # several files, so split them into one batch per CPU and run those in parallel
+    workers = min(os.cpu_count() or 1, len(so_files))
+    batches = [so_files[i::workers] for i in range(workers)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(
+            lambda batch: run_command([patchelf, "--set-rpath", "$ORIGIN", *(str(so_file) for so_file in batch)]),
+            batches
+        ))
 
 
 def copy_headers(package_prefix: Path, output_dir: Path) -> None:
@@ -207,14 +523,14 @@ def copy_headers(package_prefix: Path, output_dir: Path) -> None:
     include_dst = output_dir / "include"
     
     if include_src.exists():
-        logger.info(f"Copying headers from {include_src}")
-        shutil.copytree(include_src, include_dst, dirs_exist_ok=True)
+        logger.info("Copying headers from %s", include_src)
+        copied = copy_tree(include_src, include_dst)
         
         # Count header files
-        header_count = sum(1 for _ in include_dst.rglob("*.h"))
-        logger.info(f"  Copied {header_count} header files")
+        header_count = sum(1 for name in copied if name.endswith(".h"))
+        logger.info("  Copied %d header files", header_count)
     else:
-        logger.warning(f"Include directory not found: {include_src}")
+        logger.warning("Include directory not found: %s", include_src)
 
 
 def copy_pkgconfig(package_prefix: Path, output_dir: Path) -> None:
@@ -223,14 +539,32 @@ def copy_pkgconfig(package_prefix: Path, output_dir: Path) -> None:
     pkgconfig_dst = output_dir / "lib" / "pkgconfig"
     
     if pkgconfig_src.exists():
-        logger.info(f"Copying pkg-config files from {pkgconfig_src}")
+        logger.info("Copying pkg-config files from %s", pkgconfig_src)
         pkgconfig_dst.mkdir(parents=True, exist_ok=True)
         
         for pc_file in pkgconfig_src.glob("*.pc"):
             shutil.copy2(pc_file, pkgconfig_dst)
-            logger.info(f"  Copied: {pc_file.name}")
+            logger.info("  Copied: %s", pc_file.name)
     else:
-        logger.debug(f"No pkg-config directory found: {pkgconfig_src}")
+        logger.debug("No pkg-config directory found: %s", pkgconfig_src)
+
+
+def list_files(directory: Path) -> list[tuple[Path, int]]:
+    """List the files below a directory with their sizes, sorted by path.
+    
+    Paths are relative to directory. Each entry is stat'ed once through its
+    cached os.DirEntry; symlinks report their own size, not their target's.
+    """
+    files = []
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append((Path(entry.path).relative_to(directory), entry.stat(follow_symlinks=False).st_size))
+    return sorted(files)
 
 
 def get_arch() -> str:
@@ -284,6 +618,9 @@ def main():
     homebrew_prefix = get_homebrew_prefix()
     logger.info(f"Homebrew prefix: {homebrew_prefix}")
     
+    # Query every package we need in a single brew invocation
+    query_packages(["vips", "glib"])
+    
     # Get libvips prefix and version
     vips_prefix = get_package_prefix("vips")
     vips_version = get_package_version("vips")
@@ -309,10 +646,13 @@ def main():
     vips_lib_dir = vips_prefix / "lib"
     main_lib = None
     
+    # List the lib directory once and match every pattern below against it
+    vips_lib_names = sorted(_list_dir(vips_lib_dir))
+    
     for pattern in ["libvips.so", "libvips.so.*"]:
-        libs = list(vips_lib_dir.glob(pattern))
+        libs = fnmatch.filter(vips_lib_names, pattern)
         if libs:
-            main_lib = libs[0]
+            main_lib = vips_lib_dir / libs[0]
             break
     
     if not main_lib:
@@ -330,17 +670,24 @@ def main():
     copy_shared_libs_recursive(main_lib, lib_output_dir, copied, homebrew_prefix, search_paths)
     
     # Also explicitly look for versioned libraries
-    for lib in vips_lib_dir.glob("libvips*.so*"):
-        if lib.name not in copied:
-            copy_shared_libs_recursive(lib, lib_output_dir, copied, homebrew_prefix, search_paths)
+    for name in fnmatch.filter(vips_lib_names, "libvips*.so*"):
+        if name not in copied:
+            copy_shared_libs_recursive(vips_lib_dir / name, lib_output_dir, copied, homebrew_prefix, search_paths)
+    
+    # Aliases were recreated as symlinks to the real files; count those apart
+    libraries = sorted(copied)
+    symlinks = {name for name in libraries if (lib_output_dir / name).is_symlink()}
+    library_count = len(libraries) - len(symlinks)
     
     logger.info("-" * 40)
-    logger.info(f"Total libraries copied: {len(copied)}")
+    logger.info(f"Total libraries copied: {library_count} (plus {len(symlinks)} symlinks)")
     
     # Fix RPATH
     if args.fix_rpath:
         logger.info("")
-        fix_library_rpath(lib_output_dir)
+        with os.scandir(lib_output_dir) as entries:
+            so_files = [Path(entry.path) for entry in entries if ".so" in entry.name]
+        fix_library_rpath(lib_output_dir, so_files)
     
     # Copy headers if requested
     if args.include_headers:
@@ -363,10 +710,11 @@ def main():
         f.write(f"libvips version: {vips_version}\n")
         f.write(f"Homebrew prefix: {homebrew_prefix}\n")
         f.write(f"Architecture: {arch}\n")
-        f.write(f"Libraries copied: {len(copied)}\n")
+        f.write(f"Libraries copied: {library_count}\n")
+        f.write(f"Symlinks: {len(symlinks)}\n")
         f.write(f"\nLibraries:\n")
-        for lib in sorted(copied):
-            f.write(f"  - {lib}\n")
+        for lib in libraries:
+            f.write(f"  - {lib}{' (symlink)' if lib in symlinks else ''}\n")
     
     logger.info("")
     logger.info("=" * 60)
@@ -374,16 +722,14 @@ def main():
     logger.info("=" * 60)
     logger.info(f"libvips version: {vips_version}")
     logger.info(f"Architecture: {arch}")
-    logger.info(f"Libraries copied: {len(copied)}")
+    logger.info(f"Libraries copied: {library_count}")
     logger.info(f"Output directory: {args.output}")
     
     # List all copied files
     logger.info("")
     logger.info("Files in output directory:")
-    for item in sorted(args.output.rglob("*")):
-        if item.is_file():
-            size = item.stat().st_size
-            logger.info(f"  {item.relative_to(args.output)} ({size:,} bytes)")
+    for path, size in list_files(args.output):
+        logger.info("  %s (%s bytes)", path, format(size, ","))
     
     logger.info("")
     logger.info("Done!")
@@ -13,13 +13,29 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import ctypes
+import fnmatch
+import functools
+import json
 import logging
+import mmap
 import os
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    # Optional faster parser for the brew info JSON; its errors subclass json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Configure logging for GitHub Actions output
 logging.basicConfig(
     level=logging.INFO,
@@ -28,141 +44,403 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Mach-O constants used when reading load commands
+MH_MAGIC = 0xfeedface
+MH_MAGIC_64 = 0xfeedfacf
+FAT_MAGIC = 0xcafebabe
+FAT_MAGIC_64 = 0xcafebabf
+LC_REQ_DYLD = 0x80000000
+LC_DYLIB_COMMANDS = {
+    0xc,                  # LC_LOAD_DYLIB
+    0x18 | LC_REQ_DYLD,   # LC_LOAD_WEAK_DYLIB
+    0x1f | LC_REQ_DYLD,   # LC_REEXPORT_DYLIB
+    0x20,                 # LC_LAZY_LOAD_DYLIB
+    0x23 | LC_REQ_DYLD,   # LC_LOAD_UPWARD_DYLIB
+}
+
 
 def run_command(cmd: list[str], capture_output: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and log it."""
-    logger.info(f"Running command: {' '.join(cmd)}")
+    """Run a command, logging it at debug level."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s", " ".join(cmd))
     result = subprocess.run(cmd, capture_output=capture_output, text=True)
     if result.returncode != 0:
-        logger.error(f"Command failed with code {result.returncode}")
+        logger.error("Command failed with code %d", result.returncode)
         if result.stderr:
-            logger.error(f"stderr: {result.stderr}")
+            logger.error("stderr: %s", result.stderr)
     return result
 
 
+def run_command_lines(cmd: list[str]) -> Iterator[str]:
+    """Run a command, yielding stdout lines as they are produced.
+    
+    Raises subprocess.CalledProcessError once the output has been consumed
+    if the command failed.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s", " ".join(cmd))
+    # stderr goes to a temporary file, not a pipe: it is only read once stdout
+    # is exhausted, so a child filling a stderr pipe would never finish
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True) as proc:
+            yield from proc.stdout
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+    if proc.returncode != 0:
+        logger.error("Command failed with code %d", proc.returncode)
+        if stderr:
+            logger.error("stderr: %s", stderr)
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+
+@functools.lru_cache(maxsize=None)
 def get_homebrew_prefix() -> Path:
     """Get the Homebrew prefix path."""
+    # `brew shellenv` exports the prefix, and brew itself lives in <prefix>/bin,
+    # so both avoid spawning a brew process. The brew path is deliberately not
+    # resolved: on Intel macOS and Linuxbrew it links into the repository dir.
+    env_prefix = os.environ.get("HOMEBREW_PREFIX")
+    if env_prefix:
+        return Path(env_prefix)
+    brew = shutil.which("brew")
+    if brew and Path(brew).parent.name == "bin":
+        return Path(brew).parent.parent
+    
     result = run_command(["brew", "--prefix"])
     if result.returncode != 0:
         raise RuntimeError("Failed to get Homebrew prefix")
     return Path(result.stdout.strip())
 
 
+# Package name -> {"prefix": Path | None, "version": str}, filled by query_packages
+_package_info: dict[str, dict] = {}
+
+
+def query_packages(packages: list[str]) -> dict[str, dict]:
+    """Query prefixes and versions of several Homebrew packages in one brew call.
+    
+    Results are cached, so packages that were already queried are not passed
+    to brew again.
+    """
+    missing = [p for p in packages if p not in _package_info]
+    if missing:
+        result = run_command(["brew", "info", "--json=v2", *missing])
+        formulae = []
+        if result.returncode == 0:
+            try:
+                formulae = json_loads(result.stdout).get("formulae", [])
+            except json.JSONDecodeError:
+                pass
+        
+        homebrew_prefix = get_homebrew_prefix()
+        for formula in formulae:
+            name = formula.get("name")
+            if not name:
+                continue
+            # Same path as `brew --prefix <name>`, but only if the keg is installed
+            prefix = homebrew_prefix / "opt" / name if formula.get("installed") else None
+            info = {
+                "prefix": prefix,
+                "version": formula.get("versions", {}).get("stable") or "unknown",
+            }
+            _package_info[name] = info
+            # Also record the name it was requested under (e.g. an alias)
+            for package in missing:
+                if package in (formula.get("full_name"), *formula.get("aliases", [])):
+                    _package_info[package] = info
+        
+        # Don't ask brew again for packages it reported nothing about
+        if result.returncode == 0:
+            for package in missing:
+                _package_info.setdefault(package, {"prefix": None, "version": "unknown"})
+    
+    return {p: _package_info[p] for p in packages if p in _package_info}
+
+
 def get_package_prefix(package: str) -> Path:
     """Get the prefix path for a specific Homebrew package."""
-    result = run_command(["brew", "--prefix", package])
-    if result.returncode != 0:
+    prefix = query_packages([package]).get(package, {}).get("prefix")
+    if prefix is None:
         raise RuntimeError(f"Failed to get prefix for {package}")
-    return Path(result.stdout.strip())
+    return prefix
 
 
 def get_package_version(package: str) -> str:
     """Get the version of a Homebrew package."""
-    result = run_command(["brew", "info", "--json=v2", package])
-    if result.returncode != 0:
-        return "unknown"
-    import json
+    return query_packages([package]).get(package, {}).get("version", "unknown")
+
+
+def read_macho_dylibs(dylib_path: Path) -> list[str] | None:
+    """Read the dylib load commands of a Mach-O file.
+    
+    For universal binaries only the first architecture is read. Returns None
+    if the file could not be parsed as Mach-O.
+    """
     try:
-        data = json.loads(result.stdout)
-        if data.get("formulae"):
-            return data["formulae"][0].get("versions", {}).get("stable", "unknown")
-    except (json.JSONDecodeError, KeyError, IndexError):
-        pass
-    return "unknown"
+        with open(dylib_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = 0
+            (magic,) = struct.unpack_from(">I", data, 0)
+            if magic == FAT_MAGIC:
+                # fat_arch: cputype, cpusubtype, offset, size, align
+                (offset,) = struct.unpack_from(">I", data, 8 + 8)
+            elif magic == FAT_MAGIC_64:
+                # fat_arch_64: cputype, cpusubtype, offset (64-bit), size, align
+                (offset,) = struct.unpack_from(">Q", data, 8 + 8)
+            
+            for endian in ("<", ">"):
+                (magic,) = struct.unpack_from(endian + "I", data, offset)
+                if magic in (MH_MAGIC, MH_MAGIC_64):
+                    break
+            else:
+                return None
+            
+            ncmds, _sizeofcmds = struct.unpack_from(endian + "II", data, offset + 16)
+            cmd_offset = offset + (32 if magic == MH_MAGIC_64 else 28)
+            
+            deps = []
+            for _ in range(ncmds):
+                cmd, cmdsize = struct.unpack_from(endian + "II", data, cmd_offset)
+                if cmd in LC_DYLIB_COMMANDS:
+                    # dylib_command: cmd, cmdsize, name offset, timestamp, versions...
+                    (name_offset,) = struct.unpack_from(endian + "I", data, cmd_offset + 8)
+                    start = cmd_offset + name_offset
+                    name = data[start:cmd_offset + cmdsize].split(b"\0", 1)[0]
+                    deps.append(name.decode())
+                cmd_offset += cmdsize
+            return deps
+    except (OSError, ValueError, struct.error, UnicodeDecodeError):
+        return None
+
+
+# (st_dev, st_ino) of a library -> its dependencies, filled by get_dylib_deps
+_dep_cache: dict[tuple[int, int], list[str]] = {}
 
 
 def get_dylib_deps(dylib_path: Path) -> list[str]:
-    """Get the list of dynamic library dependencies using otool."""
-    result = run_command(["otool", "-L", str(dylib_path)])
-    if result.returncode != 0:
-        return []
+    """Get the list of dependencies of a library, cached per inode.
+    
+    Symlinked aliases and repeated lookups of the same library share one
+    cache entry, so each file's dependencies are extracted only once.
+    """
+    try:
+        st = os.stat(dylib_path)
+    except OSError:
+        return _read_dylib_deps(dylib_path)
+    
+    key = (st.st_dev, st.st_ino)
+    if key not in _dep_cache:
+        _dep_cache[key] = _read_dylib_deps(dylib_path)
+    return list(_dep_cache[key])
+
+
+def _read_dylib_deps(dylib_path: Path) -> list[str]:
+    """Get the list of dynamic library dependencies.
+    
+    Load commands are read straight from the Mach-O file, falling back to
+    otool if the file cannot be parsed.
+    """
+    deps = read_macho_dylibs(dylib_path)
+    if deps is not None:
+        return deps
     
-    deps = []
-    for line in result.stdout.splitlines()[1:]:  # Skip first line (the library itself)
-        line = line.strip()
-        if line:
-            # Extract the path (before " (compatibility version")
-            path = line.split(" (")[0].strip()
-            deps.append(path)
+    try:
+        deps = []
+        lines = run_command_lines(["otool", "-L", str(dylib_path)])
+        next(lines, None)  # Skip first line (the library itself)
+        for line in lines:
+            line = line.strip()
+            if line:
+                # Extract the path (before " (compatibility version")
+                path = line.split(" (")[0].strip()
+                deps.append(path)
+    except subprocess.CalledProcessError:
+        return []
     return deps
 
 
+@functools.lru_cache(maxsize=None)
+def _get_clonefile():
+    """Look up clonefile(2) in libc, or return None if it is unavailable."""
+    try:
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file's data and metadata.
+    
+    Uses clonefile(2), a copy-on-write clone that costs no data I/O on APFS,
+    and falls back to shutil.copyfile on other filesystems.
+    """
+    # clonefile refuses to overwrite an existing destination, and a symlink
+    # left by an earlier run must not be written through
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    
+    clonefile = _get_clonefile()
+    cloned = False
+    if clonefile is not None:
+        cloned = clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    if not cloned:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def copy_tree(src: Path, dst: Path) -> list[str]:
+    """Copy a directory tree with fast_copy, merging into an existing dst.
+    
+    Returns the names of the copied files.
+    """
+    copied = []
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = dst / entry.name
+            if entry.is_dir():
+                copied.extend(copy_tree(Path(entry.path), target))
+            elif entry.is_file():
+                fast_copy(Path(entry.path), target)
+                copied.append(entry.name)
+    return copied
+
+
 def copy_dylibs_recursive(
     lib_path: Path,
     output_dir: Path,
     copied: set[str],
     homebrew_prefix: Path
 ) -> None:
-    """Recursively copy a dylib and its dependencies."""
+    """Recursively copy a dylib and its dependencies.
+    
+    The dependency tree is walked breadth-first on a thread pool, so copying
+    one dylib overlaps with reading the dependencies of another.
+    """
+    # Already copied, e.g. as a dependency of an earlier library; don't
+    # start a pool just to find that out
+    if lib_path.name in copied:
+        return
+    
+    lock = threading.Lock()
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        pending = {executor.submit(_copy_dylib, lib_path, output_dir, copied, lock, homebrew_prefix)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for dep_path in future.result():
+                    pending.add(executor.submit(_copy_dylib, dep_path, output_dir, copied, lock, homebrew_prefix))
+
+
+def _copy_dylib(
+    lib_path: Path,
+    output_dir: Path,
+    copied: set[str],
+    lock: threading.Lock,
+    homebrew_prefix: Path
+) -> list[Path]:
+    """Copy a single dylib and return the dependencies still to visit."""
     lib_name = lib_path.name
     
     # Skip if already copied
     if lib_name in copied:
-        return
+        return []
     
     # Skip system libraries
     if str(lib_path).startswith("/usr/lib") or str(lib_path).startswith("/System"):
-        logger.debug(f"Skipping system library: {lib_path}")
-        return
+        logger.debug("Skipping system library: %s", lib_path)
+        return []
     
     if not lib_path.exists():
-        logger.warning(f"Library not found: {lib_path}")
-        return
-    
-    logger.info(f"Copying: {lib_path}")
-    
-    # Resolve symlinks to get the actual file
-    real_path = lib_path.resolve()
-    
-    # Copy the file
-    dest_path = output_dir / lib_name
-    shutil.copy2(real_path, dest_path)
-    copied.add(lib_name)
-    
-    # Also copy symlinks if the original was a symlink
-    if lib_path.is_symlink():
-        # Create the symlink in output as well
-        symlink_name = lib_path.name
-        if symlink_name != real_path.name:
-            logger.info(f"  (resolved from symlink: {symlink_name} -> {real_path.name})")
+        logger.warning("Library not found: %s", lib_path)
+        return []
     
-    logger.info(f"  -> {dest_path}")
+    # Resolve symlinks to get the actual file; plain files are used as is,
+    # which saves resolve() an lstat per path component
+    is_symlink = lib_path.is_symlink()
+    real_path = lib_path.resolve() if is_symlink else lib_path
+    
+    # Claim the library and the file it points to, so no other worker copies them as well
+    with lock:
+        if lib_name in copied:
+            return []
+        copied.add(lib_name)
+        copy_real = real_path.name not in copied
+        copied.add(real_path.name)
+    
+    logger.info("Copying: %s", lib_path)
+    
+    # Copy the real file once. Its dependencies are read from the source,
+    # which is already in the page cache, rather than from the fresh copy
+    real_dest = output_dir / real_path.name
+    if copy_real:
+        deps = get_dylib_deps(real_path)
+        fast_copy(real_path, real_dest)
+        logger.info("  -> %s", real_dest)
+    
+    # Recreate aliases as symlinks to it instead of copying the data again
+    if real_path.name != lib_name:
+        dest_path = output_dir / lib_name
+        if os.path.lexists(dest_path):
+            os.unlink(dest_path)
+        os.symlink(real_path.name, dest_path)
+        logger.info("  -> %s (symlink to %s)", dest_path, real_path.name)
+    
+    # The worker that copied the real file walks its dependencies
+    if not copy_real:
+        return []
     
-    # Get dependencies and copy them too
-    deps = get_dylib_deps(dest_path)
-    for dep in deps:
-        dep_path = Path(dep)
-        # Only copy Homebrew dependencies
-        if str(dep_path).startswith(str(homebrew_prefix)):
-            copy_dylibs_recursive(dep_path, output_dir, copied, homebrew_prefix)
+    # Collect dependencies so they get copied too
+    # Only copy Homebrew dependencies
+    return [Path(dep) for dep in deps if dep.startswith(str(homebrew_prefix))]
 
 
-def fix_library_paths(output_dir: Path) -> None:
-    """Fix library paths using install_name_tool for redistribution."""
+def fix_library_paths(output_dir: Path, dylibs: list[Path] | None = None) -> None:
+    """Fix library paths using install_name_tool for redistribution.
+    
+    dylibs may be passed in when the caller has already listed output_dir.
+    """
     logger.info("Fixing library paths for redistribution...")
     
-    dylibs = list(output_dir.glob("*.dylib"))
+    if dylibs is None:
+        dylibs = list(output_dir.glob("*.dylib"))
+    dylib_names = {dylib.name for dylib in dylibs}
+    # Symlinked aliases share the real file, which must only be rewritten once
+    dylibs = [dylib for dylib in dylibs if not dylib.is_symlink()]
     
-    for dylib in dylibs:
-        logger.info(f"Fixing: {dylib.name}")
-        
-        # Change the install name to use @rpath
-        new_id = f"@rpath/{dylib.name}"
-        run_command(["install_name_tool", "-id", new_id, str(dylib)])
+    # Each dylib is rewritten independently, so overlap the tool runs
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda dylib: _fix_dylib_paths(dylib, dylib_names), dylibs))
+
+
+def _fix_dylib_paths(dylib: Path, dylib_names: set[str]) -> None:
+    """Rewrite the install name and bundled dependencies of one dylib to @rpath."""
+    logger.info("Fixing: %s", dylib.name)
+    
+    # Change the install name to use @rpath
+    new_id = f"@rpath/{dylib.name}"
+    cmd = ["install_name_tool", "-id", new_id]
+    
+    # Fix dependencies to use @rpath; install_name_tool takes any number of
+    # -change pairs, so the whole dylib is rewritten in one run
+    changes = []
+    deps = get_dylib_deps(dylib)
+    for dep in deps:
+        dep_path = Path(dep)
+        dep_name = dep_path.name
         
-        # Fix dependencies to use @rpath
-        deps = get_dylib_deps(dylib)
-        for dep in deps:
-            dep_path = Path(dep)
-            dep_name = dep_path.name
-            
-            # Check if this dependency exists in our output directory
-            if (output_dir / dep_name).exists():
-                new_dep = f"@rpath/{dep_name}"
-                run_command([
-                    "install_name_tool", "-change", dep, new_dep, str(dylib)
-                ])
-                logger.info(f"  Changed: {dep} -> {new_dep}")
+        # Check if this dependency exists in our output directory
+        if dep_name in dylib_names:
+            new_dep = f"@rpath/{dep_name}"
+            cmd += ["-change", dep, new_dep]
+            changes.append((dep, new_dep))
+    
+    run_command(cmd + [str(dylib)])
+    for dep, new_dep in changes:
+        logger.debug("  Changed: %s -> %s", dep, new_dep)
 
 
 def copy_headers(package_prefix: Path, output_dir: Path) -> None:
@@ -171,14 +449,14 @@ def copy_headers(package_prefix: Path, output_dir: Path) -> None:
     include_dst = output_dir / "include"
     
     if include_src.exists():
-        logger.info(f"Copying headers from {include_src}")
-        shutil.copytree(include_src, include_dst, dirs_exist_ok=True)
+        logger.info("Copying headers from %s", include_src)
+        copied = copy_tree(include_src, include_dst)
         
         # Count header files
-        header_count = sum(1 for _ in include_dst.rglob("*.h"))
-        logger.info(f"  Copied {header_count} header files")
+        header_count = sum(1 for name in copied if name.endswith(".h"))
+        logger.info("  Copied %d header files", header_count)
     else:
-        logger.warning(f"Include directory not found: {include_src}")
+        logger.warning("Include directory not found: %s", include_src)
 
 
 def copy_pkgconfig(package_prefix: Path, output_dir: Path) -> None:
@@ -187,14 +465,32 @@ def copy_pkgconfig(package_prefix: Path, output_dir: Path) -> None:
     pkgconfig_dst = output_dir / "lib" / "pkgconfig"
     
     if pkgconfig_src.exists():
-        logger.info(f"Copying pkg-config files from {pkgconfig_src}")
+        logger.info("Copying pkg-config files from %s", pkgconfig_src)
         pkgconfig_dst.mkdir(parents=True, exist_ok=True)
         
         for pc_file in pkgconfig_src.glob("*.pc"):
             shutil.copy2(pc_file, pkgconfig_dst)
-            logger.info(f"  Copied: {pc_file.name}")
+            logger.info("  Copied: %s", pc_file.name)
     else:
-        logger.debug(f"No pkg-config directory found: {pkgconfig_src}")
+        logger.debug("No pkg-config directory found: %s", pkgconfig_src)
+
+
+def list_files(directory: Path) -> list[tuple[Path, int]]:
+    """List the files below a directory with their sizes, sorted by path.
+    
+    Paths are relative to directory. Each entry is stat'ed once through its
+    cached os.DirEntry; symlinks report their own size, not their target's.
+    """
+    files = []
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append((Path(entry.path).relative_to(directory), entry.stat(follow_symlinks=False).st_size))
+    return sorted(files)
 
 
 def main():
@@ -237,6 +533,9 @@ def main():
     homebrew_prefix = get_homebrew_prefix()
     logger.info(f"Homebrew prefix: {homebrew_prefix}")
     
+    # Query every package we need in a single brew invocation
+    query_packages(["vips", "glib"])
+    
     # Get libvips prefix and version
     vips_prefix = get_package_prefix("vips")
     vips_version = get_package_version("vips")
@@ -252,10 +551,13 @@ def main():
     vips_lib_dir = vips_prefix / "lib"
     main_lib = None
     
+    # List the lib directory once and match every pattern below against it
+    vips_lib_names = sorted(os.listdir(vips_lib_dir)) if vips_lib_dir.is_dir() else []
+    
     for pattern in ["libvips.dylib", "libvips.*.dylib"]:
-        libs = list(vips_lib_dir.glob(pattern))
+        libs = fnmatch.filter(vips_lib_names, pattern)
         if libs:
-            main_lib = libs[0]
+            main_lib = vips_lib_dir / libs[0]
             break
     
     if not main_lib:
@@ -273,17 +575,24 @@ def main():
     copy_dylibs_recursive(main_lib, lib_output_dir, copied, homebrew_prefix)
     
     # Also explicitly look for versioned libraries
-    for lib in vips_lib_dir.glob("libvips*.dylib"):
-        if lib.name not in copied:
-            copy_dylibs_recursive(lib, lib_output_dir, copied, homebrew_prefix)
+    for name in fnmatch.filter(vips_lib_names, "libvips*.dylib"):
+        if name not in copied:
+            copy_dylibs_recursive(vips_lib_dir / name, lib_output_dir, copied, homebrew_prefix)
+    
+    # Aliases were recreated as symlinks to the real files; count those apart
+    libraries = sorted(copied)
+    symlinks = {name for name in libraries if (lib_output_dir / name).is_symlink()}
+    library_count = len(libraries) - len(symlinks)
     
     logger.info("-" * 40)
-    logger.info(f"Total libraries copied: {len(copied)}")
+    logger.info(f"Total libraries copied: {library_count} (plus {len(symlinks)} symlinks)")
     
     # Fix library paths
     if args.fix_paths:
         logger.info("")
-        fix_library_paths(lib_output_dir)
+        with os.scandir(lib_output_dir) as entries:
+            dylibs = [Path(entry.path) for entry in entries if entry.name.endswith(".dylib")]
+        fix_library_paths(lib_output_dir, dylibs)
     
     # Copy headers if requested
     if args.include_headers:
@@ -306,10 +615,11 @@ def main():
         f.write(f"libvips version: {vips_version}\n")
         f.write(f"Homebrew prefix: {homebrew_prefix}\n")
         f.write(f"Architecture: {os.uname().machine}\n")
-        f.write(f"Libraries copied: {len(copied)}\n")
+        f.write(f"Libraries copied: {library_count}\n")
+        f.write(f"Symlinks: {len(symlinks)}\n")
         f.write(f"\nLibraries:\n")
-        for lib in sorted(copied):
-            f.write(f"  - {lib}\n")
+        for lib in libraries:
+            f.write(f"  - {lib}{' (symlink)' if lib in symlinks else ''}\n")
     
     logger.info("")
     logger.info("=" * 60)
@@ -317,16 +627,14 @@ def main():
     logger.info("=" * 60)
     logger.info(f"libvips version: {vips_version}")
     logger.info(f"Architecture: {os.uname().machine}")
-    logger.info(f"Libraries copied: {len(copied)}")
+    logger.info(f"Libraries copied: {library_count}")
     logger.info(f"Output directory: {args.output}")
     
     # List all copied files
     logger.info("")
     logger.info("Files in output directory:")
-    for item in sorted(args.output.rglob("*")):
-        if item.is_file():
-            size = item.stat().st_size
-            logger.info(f"  {item.relative_to(args.output)} ({size:,} bytes)")
+    for path, size in list_files(args.output):
+        logger.info("  %s (%s bytes)", path, format(size, ","))
     
     logger.info("")
     logger.info("Done!")
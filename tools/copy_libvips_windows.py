@@ -12,14 +12,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import http.client
+import io
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import urllib.parse
 import urllib.request
 import zipfile
+import zlib
+from dataclasses import dataclass, field
 from pathlib import Path
 
 # Configure logging for GitHub Actions output
@@ -30,10 +40,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional: ISA-L's SIMD inflate is a drop-in for zlib.decompressobj
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
 # libvips GitHub releases URL
 LIBVIPS_RELEASES_API = "https://api.github.com/repos/libvips/build-win64-mxe/releases/latest"
 LIBVIPS_RELEASES_PAGE = "https://github.com/libvips/build-win64-mxe/releases"
 
+# On-disk cache of the latest release JSON, revalidated with its ETag
+RELEASE_CACHE_BODY = Path(tempfile.gettempdir()) / "libvips_release.json"
+RELEASE_CACHE_ETAG = Path(tempfile.gettempdir()) / "libvips_release.etag"
+
 # Architecture mappings
 ARCH_MAP = {
     "x64": "w64",
@@ -43,11 +63,25 @@ ARCH_MAP = {
     "aarch64": "arm64",
 }
 
+# Parallel range requests used to download a whole archive, and the size of
+# each request
+DOWNLOAD_WORKERS = 6
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Buffer size used when streaming archive members into the output
+EXTRACT_BUFFER_SIZE = 8 << 20
+
 
 def run_command(cmd: list[str], capture_output: bool = True) -> subprocess.CompletedProcess:
     """Run a command and log it."""
     logger.info(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=capture_output, text=True, shell=(os.name == 'nt'))
+    # cmd is already an argv list, so no shell is needed to run it
+    result = subprocess.run(
+        cmd,
+        capture_output=capture_output,
+        text=True,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    )
     if result.returncode != 0:
         logger.error(f"Command failed with code {result.returncode}")
         if result.stderr:
@@ -56,21 +90,53 @@ def run_command(cmd: list[str], capture_output: bool = True) -> subprocess.Compl
 
 
 def get_latest_release_info() -> dict:
-    """Get the latest release information from GitHub API."""
+    """Get the latest release information from GitHub API.
+    
+    The response is cached on disk together with its ETag. Later runs send a
+    conditional request and reuse the cached copy when GitHub answers 304,
+    which also doesn't count against the API rate limit.
+    """
     import json
     
     logger.info("Fetching latest release information from GitHub...")
     
+    headers = {"Accept": "application/vnd.github.v3+json", "User-Agent": "libvips-precompile-mobile"}
+    cached_etag = None
+    if RELEASE_CACHE_ETAG.exists() and RELEASE_CACHE_BODY.exists():
+        cached_etag = RELEASE_CACHE_ETAG.read_text().strip()
+        headers["If-None-Match"] = cached_etag
+    
     try:
-        req = urllib.request.Request(
-            LIBVIPS_RELEASES_API,
-            headers={"Accept": "application/vnd.github.v3+json", "User-Agent": "libvips-precompile-mobile"}
-        )
+        req = urllib.request.Request(LIBVIPS_RELEASES_API, headers=headers)
         with urllib.request.urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode())
+            body = response.read()
+            etag = response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_etag is not None:
+            logger.info("Release information unchanged, using cached copy")
+            return json.loads(RELEASE_CACHE_BODY.read_bytes())
+        logger.error(f"Failed to fetch release info: {e}")
+        raise
     except urllib.error.URLError as e:
         logger.error(f"Failed to fetch release info: {e}")
         raise
+    
+    if etag:
+        _write_release_cache(body, etag)
+    return json.loads(body)
+
+
+def _write_release_cache(body: bytes, etag: str) -> None:
+    """Store the release JSON and its ETag, replacing each file atomically."""
+    try:
+        # Drop the old ETag first so it can never be paired with the new body
+        RELEASE_CACHE_ETAG.unlink(missing_ok=True)
+        for path, data in ((RELEASE_CACHE_BODY, body), (RELEASE_CACHE_ETAG, etag.encode())):
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not cache release info: {e}")
 
 
 def find_asset_for_arch(release_info: dict, arch: str, build_type: str = "web") -> tuple[str, str] | None:
@@ -88,81 +154,339 @@ def find_asset_for_arch(release_info: dict, arch: str, build_type: str = "web")
     
     logger.info(f"Looking for architecture: {arch} (suffix: {arch_suffix}), build type: {build_type}")
     
-    # Look for the asset with specific build type
     # Pattern: vips-dev-w64-{web|all}-X.Y.Z-static.zip or vips-dev-arm64-{web|all}-X.Y.Z-static.zip
-    for asset in release_info.get("assets", []):
-        name = asset["name"]
-        if arch_suffix in name and build_type in name and name.endswith(".zip"):
-            # Prefer non-ffi versions for simplicity
-            if "ffi" not in name:
-                logger.info(f"Found asset: {name}")
-                return asset["browser_download_url"], name
+    pattern = re.compile(rf"(?:^|[-_]){re.escape(arch_suffix)}[-_].*{re.escape(build_type)}.*\.zip$")
     
-    # Fallback: look for any matching zip with build type
+    # Single pass: prefer non-ffi versions for simplicity, otherwise fall back
+    # to the first matching ffi one
+    best = None
     for asset in release_info.get("assets", []):
         name = asset["name"]
-        if arch_suffix in name and build_type in name and name.endswith(".zip"):
-            logger.info(f"Found fallback asset: {name}")
-            return asset["browser_download_url"], name
-    
-    return None
+        if not pattern.search(name):
+            continue
+        if "ffi" not in name:
+            best = asset
+            break
+        if best is None:
+            best = asset
+    
+    if best is None:
+        return None
+    
+    name = best["name"]
+    logger.info(f"Found {'fallback ' if 'ffi' in name else ''}asset: {name}")
+    return best["browser_download_url"], name
 
 
-def download_file(url: str, dest_path: Path) -> None:
-    """Download a file with progress indication."""
+class DownloadProgress:
+    """Thread-safe byte counter that logs download progress in 5% steps."""
+    
+    def __init__(self, total_size: int):
+        self.total_size = total_size
+        self.downloaded = 0
+        self._step = 0
+        self._lock = threading.Lock()
+    
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.downloaded += count
+            if self.total_size > 0:
+                step = self.downloaded * 20 // self.total_size
+                if step != self._step:
+                    self._step = step
+                    percent = (self.downloaded / self.total_size) * 100
+                    logger.info(f"  Progress: {self.downloaded:,} / {self.total_size:,} bytes ({percent:.1f}%)")
+
+
+def download_file(url: str, dest_path: Path, expected_digest: str | None = None) -> str:
+    """Download a file with progress indication and return its SHA-256.
+    
+    When the server supports range requests the file is fetched in
+    DOWNLOAD_WORKERS parallel slices, each over its own connection.
+    
+    expected_digest is the "sha256:<hex>" digest GitHub publishes for release
+    assets; the download fails if it doesn't match.
+    """
     logger.info(f"Downloading: {url}")
     logger.info(f"Destination: {dest_path}")
     
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "libvips-precompile-mobile"})
-        with urllib.request.urlopen(req, timeout=300) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            block_size = 8192
-            
-            with open(dest_path, 'wb') as f:
-                while True:
-                    block = response.read(block_size)
-                    if not block:
-                        break
-                    f.write(block)
-                    downloaded += len(block)
-                    
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        if downloaded % (block_size * 100) == 0 or downloaded == total_size:
-                            logger.info(f"  Progress: {downloaded:,} / {total_size:,} bytes ({percent:.1f}%)")
+        digest = None
+        remote = RemoteZipFile.open(url)
+        if remote is not None and remote.size >= DOWNLOAD_WORKERS * DOWNLOAD_CHUNK_SIZE:
+            try:
+                with remote:
+                    digest = _download_ranges(remote.url, remote.size, dest_path)
+            except (OSError, http.client.HTTPException) as e:
+                # The probe can succeed while later ranges fail; a plain GET
+                # may still work
+                logger.warning(f"Range download failed, retrying as a single request: {e}")
+        elif remote is not None:
+            remote.close()
+        if digest is None:
+            digest = _download_stream(url, dest_path)
         
         logger.info(f"Download complete: {dest_path.stat().st_size:,} bytes")
-    except urllib.error.URLError as e:
+    except (OSError, http.client.HTTPException) as e:
         logger.error(f"Download failed: {e}")
         raise
+    
+    logger.info(f"SHA-256: {digest}")
+    if expected_digest and expected_digest.lower() != f"sha256:{digest}":
+        raise OSError(f"Checksum mismatch for {dest_path.name}: expected {expected_digest}, got sha256:{digest}")
+    return digest
 
 
-def extract_zip(zip_path: Path, extract_dir: Path) -> Path:
-    """Extract a zip file and return the extracted directory."""
-    logger.info(f"Extracting: {zip_path}")
-    logger.info(f"To: {extract_dir}")
+def _download_stream(url: str, dest_path: Path) -> str:
+    """Download a file sequentially over a single connection and return its SHA-256."""
+    req = urllib.request.Request(url, headers={"User-Agent": "libvips-precompile-mobile"})
+    with urllib.request.urlopen(req, timeout=300) as response:
+        progress = DownloadProgress(int(response.headers.get('content-length', 0)))
+        # Hashed while streaming, so there is no second pass over the file
+        sha256 = hashlib.sha256()
+        
+        with open(dest_path, 'wb') as f:
+            # Preallocate so the file system can lay the file out in one go
+            if progress.total_size:
+                f.truncate(progress.total_size)
+            while True:
+                block = response.read(DOWNLOAD_CHUNK_SIZE)
+                if not block:
+                    break
+                sha256.update(block)
+                f.write(block)
+                progress.add(len(block))
+    
+    if progress.total_size and progress.downloaded != progress.total_size:
+        raise OSError(f"Download truncated: got {progress.downloaded:,} of {progress.total_size:,} bytes")
+    return sha256.hexdigest()
+
+
+def _download_ranges(url: str, size: int, dest_path: Path) -> str:
+    """Download a file as parallel HTTP range requests written at their offsets.
     
-    with zipfile.ZipFile(zip_path, 'r') as zf:
-        # List contents
-        names = zf.namelist()
-        logger.info(f"  Archive contains {len(names)} entries")
+    Returns the file's SHA-256.
+    """
+    logger.info(f"  Using {DOWNLOAD_WORKERS} parallel range requests")
+    
+    # Preallocate so every worker can write its slice in place
+    with open(dest_path, 'wb') as f:
+        f.truncate(size)
+    
+    progress = DownloadProgress(size)
+    
+    def fetch_slice(start: int, end: int) -> None:
+        # Every worker keeps its own keep-alive connection and file handle
+        with RemoteZipFile(url, size) as remote, open(dest_path, 'r+b') as f:
+            f.seek(start)
+            for offset in range(start, end, DOWNLOAD_CHUNK_SIZE):
+                block = remote.fetch(offset, min(offset + DOWNLOAD_CHUNK_SIZE, end))
+                f.write(block)
+                progress.add(len(block))
+    
+    bounds = [size * i // DOWNLOAD_WORKERS for i in range(DOWNLOAD_WORKERS + 1)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        list(executor.map(fetch_slice, bounds[:-1], bounds[1:]))
+    
+    # Slices arrive out of order and SHA-256 can't be combined from parts,
+    # so hash the finished file; it is still in the page cache at this point
+    sha256 = hashlib.sha256()
+    with open(dest_path, 'rb') as f:
+        while True:
+            block = f.read(DOWNLOAD_CHUNK_SIZE)
+            if not block:
+                break
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class RemoteZipFile(io.RawIOBase):
+    """Seekable, read-only view of a remote file backed by HTTP range requests.
+    
+    zipfile.ZipFile only needs read/seek/tell, so it can read the central
+    directory and the members it opens through this without the rest of the
+    archive ever being downloaded. All requests share one keep-alive
+    connection.
+    """
+    
+    # Bytes fetched per range request when zipfile asks for less, so the
+    # small local headers and neighbouring small members come in one request
+    READ_AHEAD = 1 << 20
+    
+    def __init__(self, url: str, size: int):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.requests = 0
+        self._pos = 0
+        self._buf = b""
+        self._buf_start = 0
+        
+        parts = urllib.parse.urlsplit(url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._conn = connection_class(parts.netloc, timeout=300)
+        self._path = parts.path + (f"?{parts.query}" if parts.query else "")
+    
+    @classmethod
+    def open(cls, url: str) -> RemoteZipFile | None:
+        """Probe url and return a RemoteZipFile, or None if it can't serve ranges."""
+        # A one-byte range GET rather than HEAD: urllib turns a redirected HEAD
+        # into a full GET, and a 206 reply proves ranges work on the final URL
+        req = urllib.request.Request(url, headers={"Range": "bytes=0-0", "User-Agent": "libvips-precompile-mobile"})
+        try:
+            with urllib.request.urlopen(req, timeout=30) as response:
+                # Redirects are followed once here, e.g. to the release asset CDN
+                final_url = response.geturl()
+                status = response.status
+                # Content-Range: bytes 0-0/<total size>
+                content_range = response.headers.get("content-range", "")
+        except urllib.error.URLError as e:
+            logger.debug(f"Range probe failed: {e}")
+            return None
+        
+        size = content_range.rpartition("/")[2]
+        if status != 206 or not size.isdigit():
+            return None
+        
+        # Range reads use a direct http.client connection, which doesn't go
+        # through HTTP(S)_PROXY like urllib does, so leave proxied URLs to urllib
+        parts = urllib.parse.urlsplit(final_url)
+        if urllib.request.getproxies().get(parts.scheme) and not urllib.request.proxy_bypass(parts.hostname or ""):
+            logger.debug(f"Not using range requests through a proxy for {parts.hostname}")
+            return None
+        return cls(final_url, int(size))
+    
+    def __str__(self) -> str:
+        return self.url
+    
+    def clone(self) -> RemoteZipFile:
+        """Return an independent reader of the same file with its own connection.
         
-        # Extract
-        zf.extractall(extract_dir)
+        The clone starts with a copy of this reader's buffer, so once a ZipFile
+        has read the central directory through this reader, opening another
+        ZipFile on the clone doesn't fetch it again.
+        """
+        other = type(self)(self.url, self.size)
+        other._buf = self._buf
+        other._buf_start = self._buf_start
+        return other
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._pos = max(0, offset)
+        return self._pos
+    
+    def readinto(self, b) -> int:
+        n = min(len(b), self.size - self._pos)
+        if n <= 0:
+            return 0
+        
+        start = self._pos - self._buf_start
+        if start < 0 or start + n > len(self._buf):
+            # Keep the buffered bytes that are still wanted and fetch the rest
+            keep = self._buf[start:] if 0 <= start < len(self._buf) else b""
+            end = min(self._pos + max(n, self.READ_AHEAD), self.size)
+            self._buf = keep + self.fetch(self._pos + len(keep), end)
+            self._buf_start = self._pos
+            start = 0
+        
+        b[:n] = self._buf[start:start + n]
+        self._pos += n
+        return n
+    
+    def fetch(self, start: int, end: int) -> bytes:
+        """Fetch bytes [start, end) with a single range request."""
+        headers = {"Range": f"bytes={start}-{end - 1}", "User-Agent": "libvips-precompile-mobile"}
+        for attempt in range(2):
+            try:
+                self._conn.request("GET", self._path, headers=headers)
+                response = self._conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # The server may close an idle keep-alive connection; reconnect once
+                self._conn.close()
+                if attempt:
+                    raise
+        
+        if response.status != 206 or len(data) != end - start:
+            raise OSError(f"Range request for bytes {start}-{end - 1} failed with HTTP {response.status}")
+        self.requests += 1
+        return data
+    
+    def close(self) -> None:
+        self._conn.close()
+        super().close()
+
+
+class _IsalInflateZlib:
+    """Stand-in for the zlib module that only inflates with ISA-L.
     
-    # Find the extracted directory (usually the first level)
-    extracted_dirs = [d for d in extract_dir.iterdir() if d.is_dir()]
-    if extracted_dirs:
-        logger.info(f"  Extracted to: {extracted_dirs[0]}")
-        return extracted_dirs[0]
+    Everything else, compression included, is forwarded to stdlib zlib, as
+    ISA-L only supports compression levels 0-3.
+    """
+    
+    def __getattr__(self, name: str):
+        return getattr(zlib, name)
     
-    return extract_dir
+    @staticmethod
+    def decompressobj(*args, **kwargs):
+        return isal_zlib.decompressobj(*args, **kwargs)
 
 
-def copy_libraries(source_dir: Path, output_dir: Path, include_headers: bool = True) -> list[str]:
-    """Copy DLL files and optionally headers to the output directory.
+@contextlib.contextmanager
+def _isal_inflate():
+    """Make zipfile inflate deflated members with ISA-L while active.
+    
+    This relies on zipfile._get_decompressor looking up the module-global
+    zlib on each call. crc32 is bound when zipfile is imported, so CRC checks
+    stay on stdlib zlib. Does nothing when isal is not installed.
+    """
+    if isal_zlib is None:
+        yield
+        return
+    original = zipfile.zlib
+    zipfile.zlib = _IsalInflateZlib()
+    try:
+        yield
+    finally:
+        zipfile.zlib = original
+
+
+@dataclass
+class CopyStats:
+    """What extract_needed wrote to the output directory."""
+    
+    # Names of the DLLs copied to lib/
+    libraries: list[str] = field(default_factory=list)
+    headers: int = 0
+    pc_files: int = 0
+    # (path relative to the output directory, size) of every file written
+    files: list[tuple[str, int]] = field(default_factory=list)
+    
+    @property
+    def dlls(self) -> int:
+        return len(self.libraries)
+
+
+def extract_needed(
+    zip_path: Path | RemoteZipFile,
+    output_dir: Path,
+    include_headers: bool = True
+) -> CopyStats:
+    """Extract DLL files and optionally headers straight into the output directory.
     
     This function extracts only the minimal files needed for FFI bindings:
     - DLL files (dynamic libraries for runtime loading)
@@ -173,63 +497,148 @@ def copy_libraries(source_dir: Path, output_dir: Path, include_headers: bool = T
     - Linux: .so files + headers
     - iOS: .xcframework (static)
     - Android: .so files in jniLibs + headers
+    
+    Every other archive entry (static libraries, executables, locale data, ...)
+    is skipped without being decompressed.
+    
+    Returns a CopyStats, filled in as the members are selected.
     """
-    copied_files = []
+    logger.info(f"Extracting: {zip_path}")
+    logger.info(f"To: {output_dir}")
     
-    # Copy DLL files to lib directory (consistent with macOS/Linux which use lib/)
-    bin_src = source_dir / "bin"
-    lib_dst = output_dir / "lib"
+    stats = CopyStats()
+    jobs = []
+    # Output directories already created, so each is made once, not per file
+    created_dirs = set()
     
-    if bin_src.exists():
-        logger.info(f"Copying DLL files from {bin_src}")
-        lib_dst.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        infos = zf.infolist()
+        logger.info(f"  Archive contains {len(infos)} entries")
         
-        for dll in bin_src.glob("*.dll"):
-            shutil.copy2(dll, lib_dst)
-            copied_files.append(dll.name)
-            logger.info(f"  Copied: {dll.name}")
-    else:
-        logger.warning(f"Bin directory not found: {bin_src}")
-    
-    # Copy include directory (headers) - needed for FFI code generation
-    if include_headers:
-        include_src = source_dir / "include"
-        include_dst = output_dir / "include"
+        # Entries usually live below a single top-level directory (vips-dev-X.Y/)
+        root = infos[0].filename.split("/", 1)[0] + "/" if infos else ""
+        if not all(info.filename.startswith(root) for info in infos):
+            root = ""
         
-        if include_src.exists():
-            logger.info(f"Copying headers from {include_src}")
-            shutil.copytree(include_src, include_dst, dirs_exist_ok=True)
+        for info in infos:
+            if info.is_dir():
+                continue
+            parts = info.filename[len(root):].split("/")
+            if ".." in parts:
+                logger.warning(f"  Skipping unsafe entry: {info.filename}")
+                continue
             
-            header_count = sum(1 for _ in include_dst.rglob("*.h"))
-            logger.info(f"  Copied {header_count} header files")
-        else:
-            logger.debug(f"Include directory not found: {include_src}")
-    
-    # Copy pkg-config files (useful for build systems)
-    pkgconfig_src = source_dir / "lib" / "pkgconfig"
-    pkgconfig_dst = output_dir / "lib" / "pkgconfig"
-    
-    if pkgconfig_src.exists():
-        logger.info(f"Copying pkg-config files from {pkgconfig_src}")
-        pkgconfig_dst.mkdir(parents=True, exist_ok=True)
-        
-        for pc_file in pkgconfig_src.glob("*.pc"):
-            shutil.copy2(pc_file, pkgconfig_dst)
-            logger.info(f"  Copied: {pc_file.name}")
-    else:
-        logger.debug(f"No pkg-config directory found: {pkgconfig_src}")
+            # DLL files go to lib (consistent with macOS/Linux which use lib/)
+            if len(parts) == 2 and parts[0] == "bin" and parts[1].endswith(".dll"):
+                dst = output_dir / "lib" / parts[1]
+                stats.libraries.append(parts[1])
+            # Headers - needed for FFI code generation
+            elif include_headers and len(parts) > 1 and parts[0] == "include":
+                dst = output_dir.joinpath(*parts)
+                if parts[-1].endswith(".h"):
+                    stats.headers += 1
+            # pkg-config files (useful for build systems)
+            elif len(parts) == 3 and parts[:2] == ["lib", "pkgconfig"] and parts[2].endswith(".pc"):
+                dst = output_dir / "lib" / "pkgconfig" / parts[2]
+                stats.pc_files += 1
+            else:
+                continue
+            
+            if dst.parent not in created_dirs:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(dst.parent)
+            jobs.append((info, dst))
+            stats.files.append((dst.relative_to(output_dir).as_posix(), info.file_size))
+    
+    # Each member is an independent deflate stream and zlib releases the GIL
+    # while inflating, so members are decompressed on a thread pool. A ZipFile
+    # handle is not safe to share between threads, so each worker opens its own
+    # and extracts one contiguous run of the archive: for the remote archive
+    # that keeps each worker's read-ahead useful instead of several workers
+    # fetching the same windows.
+    remote = isinstance(zip_path, RemoteZipFile)
+    jobs.sort(key=lambda job: job[0].header_offset)
+    workers = max(1, min(DOWNLOAD_WORKERS if remote else os.cpu_count() or 1, len(jobs)))
+    
+    # Split at roughly equal amounts of compressed data
+    runs = [[] for _ in range(workers)]
+    total = sum(info.compress_size for info, _ in jobs) or 1
+    done = 0
+    for info, dst in jobs:
+        runs[min(done * workers // total, workers - 1)].append((info, dst))
+        done += info.compress_size
+    
+    def extract_run(run: list[tuple[zipfile.ZipInfo, Path]]) -> int:
+        """Extract a run of members and return the range requests it made."""
+        source = zip_path.clone() if remote else zip_path
+        try:
+            with zipfile.ZipFile(source, 'r') as zf:
+                for info, dst in run:
+                    # Large reads straight into an unbuffered file: the DLLs are
+                    # several MiB each, so this keeps the syscall count low
+                    with zf.open(info) as src, open(dst, 'wb', buffering=0) as dst_f:
+                        shutil.copyfileobj(src, dst_f, EXTRACT_BUFFER_SIZE)
+                    # Headers are only counted, DLLs and .pc files are listed
+                    if dst.suffix in (".dll", ".pc"):
+                        logger.info(f"  Copied: {dst.name}")
+        finally:
+            if remote:
+                source.close()
+        return source.requests if remote else 0
+    
+    with _isal_inflate(), concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        requests = sum(executor.map(extract_run, [run for run in runs if run]))
+    if remote:
+        zip_path.requests += requests
+    
+    if not stats.libraries:
+        logger.warning(f"No DLL files found in {zip_path}")
+    if include_headers:
+        logger.info(f"  Copied {stats.headers} header files")
     
-    return copied_files
+    return stats
+
+
+# First dash-separated dotted number, e.g. 8.17.0 in vips-dev-w64-web-8.17.0-static.zip
+_VERSION_RE = re.compile(r"-(\d+(?:\.\d+)*)")
 
 
 def get_version_from_filename(filename: str) -> str:
     """Extract version from the download filename."""
-    # Pattern: vips-dev-w64-web-8.17.0-static.zip
-    parts = filename.replace(".zip", "").split("-")
-    for part in parts:
-        if part[0].isdigit():
-            return part
-    return "unknown"
+    match = _VERSION_RE.search(filename)
+    return match.group(1) if match else "unknown"
+
+
+def is_output_up_to_date(output_dir: Path, release_tag: str, filename: str, include_headers: bool) -> bool:
+    """Check whether output_dir already holds the given release asset.
+    
+    VERSION.txt from a previous run must name the same release tag and asset
+    filename (which encodes architecture, build type and version), and every
+    DLL it lists must still be present in lib/.
+    """
+    version_file = output_dir / "VERSION.txt"
+    try:
+        lines = version_file.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+    
+    fields = {}
+    libraries = []
+    for line in lines:
+        if line.startswith("  - "):
+            libraries.append(line[4:])
+        else:
+            key, sep, value = line.partition(": ")
+            if sep:
+                fields[key] = value
+    
+    if fields.get("Release tag") != release_tag or fields.get("Filename") != filename:
+        return False
+    if not libraries or not all((output_dir / "lib" / name).is_file() for name in libraries):
+        return False
+    if include_headers and not (output_dir / "include").is_dir():
+        return False
+    return True
 
 
 def main():
@@ -302,47 +711,77 @@ def main():
     
     download_url, filename = asset
     version = get_version_from_filename(filename)
+    # GitHub publishes a "sha256:<hex>" digest for release assets
+    asset_digest = next(
+        (a.get("digest") for a in release_info.get("assets", []) if a["name"] == filename),
+        None
+    )
     logger.info(f"Download URL: {download_url}")
     logger.info(f"Filename: {filename}")
     logger.info(f"Version: {version}")
     
+    # Nothing to do when a previous run already extracted this exact asset
+    if is_output_up_to_date(args.output, release_tag, filename, args.include_headers):
+        logger.info("")
+        logger.info(f"Output is up to date with {release_tag} ({filename}), skipping download")
+        return 0
+    
     # Create output directory
     args.output.mkdir(parents=True, exist_ok=True)
+    # VERSION.txt marks a complete extraction, so drop any previous one before
+    # files start being overwritten; it is written again at the end
+    version_file = args.output / "VERSION.txt"
+    version_file.unlink(missing_ok=True)
     
-    # Download to temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        zip_path = temp_path / filename
-        
+    # Read only the needed members over HTTP when the server supports ranges
+    stats = None
+    remote = RemoteZipFile.open(download_url)
+    if remote is not None:
         logger.info("")
-        logger.info("Downloading pre-built binaries...")
+        logger.info("Extracting libraries from the remote archive...")
         logger.info("-" * 40)
-        download_file(download_url, zip_path)
-        
-        logger.info("")
-        logger.info("Extracting archive...")
-        logger.info("-" * 40)
-        extracted_dir = extract_zip(zip_path, temp_path)
-        
-        logger.info("")
-        logger.info("Copying libraries...")
-        logger.info("-" * 40)
-        copied_files = copy_libraries(extracted_dir, args.output, args.include_headers)
-    
-    # Create version info file
-    version_file = args.output / "VERSION.txt"
-    with open(version_file, "w") as f:
-        f.write(f"libvips version: {version}\n")
-        f.write(f"Release tag: {release_tag}\n")
-        f.write(f"Architecture: {args.arch}\n")
-        f.write(f"Build type: {args.build_type}\n")
-        f.write(f"Source: {LIBVIPS_RELEASES_PAGE}\n")
-        f.write(f"Download URL: {download_url}\n")
-        f.write(f"Filename: {filename}\n")
-        f.write(f"\nDLLs copied: {len([f for f in copied_files if f.endswith('.dll')])}\n")
-        f.write(f"\nLibraries:\n")
-        for file in sorted(copied_files):
-            f.write(f"  - {file}\n")
+        try:
+            with remote:
+                stats = extract_needed(remote, args.output, args.include_headers)
+                logger.info(f"Fetched {remote.requests} ranges of the {remote.size:,} byte archive")
+        except (OSError, http.client.HTTPException, zipfile.BadZipFile) as e:
+            logger.warning(f"Remote extraction failed, downloading the whole archive instead: {e}")
+            stats = None
+    
+    # Otherwise download to temp directory
+    if stats is None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            zip_path = temp_path / filename
+            
+            logger.info("")
+            logger.info("Downloading pre-built binaries...")
+            logger.info("-" * 40)
+            download_file(download_url, zip_path, asset_digest)
+            
+            logger.info("")
+            logger.info("Extracting libraries...")
+            logger.info("-" * 40)
+            stats = extract_needed(zip_path, args.output, args.include_headers)
+    
+    # Create version info file, built in memory and written in one go
+    lines = [
+        f"libvips version: {version}",
+        f"Release tag: {release_tag}",
+        f"Architecture: {args.arch}",
+        f"Build type: {args.build_type}",
+        f"Source: {LIBVIPS_RELEASES_PAGE}",
+        f"Download URL: {download_url}",
+        f"Filename: {filename}",
+        "",
+        f"DLLs copied: {stats.dlls}",
+        "",
+        "Libraries:",
+        *(f"  - {file}" for file in sorted(stats.libraries)),
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    version_file.write_bytes(payload)
+    stats.files.append((version_file.name, len(payload)))
     
     logger.info("")
     logger.info("=" * 60)
@@ -352,16 +791,17 @@ def main():
     logger.info(f"Release tag: {release_tag}")
     logger.info(f"Architecture: {args.arch}")
     logger.info(f"Build type: {args.build_type}")
-    logger.info(f"DLLs copied: {len([f for f in copied_files if f.endswith('.dll')])}")
+    logger.info(f"DLLs copied: {stats.dlls}")
     logger.info(f"Output directory: {args.output}")
     
-    # List all copied files
+    # List the written files from what extraction recorded, not by walking
+    # the output tree again; the per-file list is only shown when verbose
+    total_size = sum(size for _, size in stats.files)
     logger.info("")
-    logger.info("Files in output directory:")
-    for item in sorted(args.output.rglob("*")):
-        if item.is_file():
-            size = item.stat().st_size
-            logger.info(f"  {item.relative_to(args.output)} ({size:,} bytes)")
+    logger.info(f"Files written: {len(stats.files)} ({total_size:,} bytes)")
+    if logger.isEnabledFor(logging.DEBUG):
+        for path, size in sorted(stats.files):
+            logger.debug(f"  {path} ({size:,} bytes)")
     
     logger.info("")
     logger.info("Done!")